@@ -15,8 +15,9 @@ class Average:
         '''
         Update the average with a new value given a sample index.
         '''
-        self.values[id] = (self.values.get(id, 0)  * (sample - 1) + value) / sample
-        return self.values[id]
+        average = (self.values.get(id, 0) * (sample - 1) + value) / sample
+        self.values[id] = average
+        return average
 
     def reset(self):
         '''